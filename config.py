@@ -31,7 +31,9 @@ SCRAPING_CONFIG = {
 BROWSER_CONFIG = {
     "headless": True,
     "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
-    "window_size": "1920,1080"
+    "window_size": "1920,1080",
+    "recycle_after": 100,  # relaunch the shared browser after this many page checkouts
+    "user_data_dir": None  # set to a directory to keep Chromium's HTTP cache (and cookies) across runs
 }
 
 # Rating Tags for GAI Insights
@@ -62,7 +64,8 @@ AGGREGATED_FETCH_POLICY = {
     "retry_backoff_base": 2,      # exponential base
     "retry_jitter": 0.7,          # additional random seconds
     "per_domain_min_interval": 10,# minimum seconds between requests to same domain
-    "timeout": 25
+    "timeout": 25,
+    "max_workers": 8              # concurrent source fetches (pacing stays per-domain)
 }
 
 # (Former LinkedIn patterns removed)
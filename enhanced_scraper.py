@@ -3,24 +3,67 @@
 Enhanced RSS scraper with better error handling and configuration management.
 """
 
+import atexit
+import contextlib
+import functools
 import json
 import hashlib
+import io
 import logging
 import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
+from bs4 import BeautifulSoup, SoupStrainer
 import xml.etree.ElementTree as ET
 import urllib.request
 from urllib.error import URLError, HTTPError
 from urllib.parse import urlparse
+from xml.sax.saxutils import escape as xml_escape
 import requests
+from requests.adapters import HTTPAdapter
 import random
 import time
 import re
-from dateutil import parser as date_parser
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+# Playwright, feedgen and dateutil are imported where used: runs that never
+# launch the browser or fall back to them should not pay their import cost
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser where lxml is unavailable
+try:
+    import lxml.html
+    from lxml import etree as lxml_etree
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_etree = None
+    _HTML_PARSER = 'html.parser'
+
+# orjson is much faster; the stdlib fallback produces byte-identical output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj, indent=False, sort_keys=False):
+    """Serialise to UTF-8 JSON bytes (2-space indent or compact, non-ASCII kept as-is)."""
+    if orjson:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+    return text.encode('utf-8')
 
 # Import configuration
 from config import *
@@ -32,12 +75,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# GAI feed settings, resolved once at import
+_GAI_META = RSS_METADATA["gai"]
+_GAI_MAIN = RSS_FEED_FILES["gai"]
+_GAI_ARCHIVE = RSS_FEED_FILES.get("gai_archive", "ai_rss_feed_archive.xml")
+
+# Rating -> title suffix, keyed by lowercased rating so each row needs one probe
+_RATING_TAGS_LOWER = {k.lower(): v for k, v in RATING_TAGS.items()}
+
+# Lowercased header names / cell values used to identify GAI table columns
+_DATE_HEADERS = frozenset({'date', 'published', 'time'})
+_RATING_HEADERS = frozenset({'rating', 'score'})
+_RATING_VALUES = frozenset({'essential', 'important', 'optional'})
+_DIGIT_RE = re.compile(r'\d')
+_COLUMN_ROLES = (
+    ('date', _DATE_HEADERS),
+    ('rating', _RATING_HEADERS),
+    ('title', frozenset({'title', 'headline', 'article'})),
+    ('desc', frozenset({'rationale', 'description', 'summary'})),
+)
+_EMPTY_CELL = {'text': '', 'links': []}
+
+# Date shapes accepted by RSSGenerator._parse_date
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_DATE_DEFAULT_A = datetime(2000, 1, 1)
+_DATE_DEFAULT_B = datetime(2001, 2, 2)
+
+# Characters that are not allowed in XML 1.0 documents
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+# Runs inside the page: returns header texts plus [text, hrefs] per cell for the
+# target table (null if absent). Text mirrors BeautifulSoup's get_text(strip=True).
+_TABLE_EXTRACT_JS = """
+(tableId) => {
+    const table = Array.from(document.getElementsByTagName('table')).find(t => t.id === tableId);
+    if (!table) return null;
+    const text = (el) => {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const parent = node.parentNode ? node.parentNode.nodeName : '';
+            if (parent === 'SCRIPT' || parent === 'STYLE') continue;
+            const value = node.nodeValue.trim();
+            if (value) parts.push(value);
+        }
+        return parts.join('');
+    };
+    const headerRow = table.querySelector('thead') || table.querySelector('tr');
+    const headers = headerRow ? Array.from(headerRow.querySelectorAll('th, td'), text) : [];
+    const tbody = table.querySelector('tbody');
+    const rows = tbody ? Array.from(tbody.querySelectorAll('tr')) : Array.from(table.querySelectorAll('tr')).slice(1);
+    return {
+        headers: headers,
+        rows: rows.map(row => Array.from(row.querySelectorAll('td, th'), cell => [
+            text(cell),
+            Array.from(cell.querySelectorAll('a[href]'), a => a.getAttribute('href')),
+        ])),
+    };
+}
+"""
+
+# Outer HTML of the target table (null if absent), so the fallback parser never sees the rest of the page
+_TABLE_HTML_JS = """
+(tableId) => {
+    const table = Array.from(document.getElementsByTagName('table')).find(t => t.id === tableId);
+    return table ? table.outerHTML : null;
+}
+"""
+
+# Truthy once the target table has at least one body row
+_TABLE_ROWS_READY_JS = """
+(tableId) => {
+    const table = document.getElementById(tableId);
+    return !!table && table.querySelectorAll('tbody tr').length > 0;
+}
+"""
+
 class RSSScraperError(Exception):
     """Custom exception for RSS scraper errors."""
     pass
 
+# Resource types aborted by the scraper's request router
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+def _route_skip_assets(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
 class BrowserManager:
-    """Context manager for a Playwright browser page (replaces Selenium WebDriver)."""
+    """Shared Playwright browser for scraping (replaces Selenium WebDriver).
+
+    Playwright and the browser are started lazily on first use and kept warm
+    for the rest of the process. Each checkout (``with manager as page``) gets
+    a fresh context, closed again on exit, so pages never share cookies or
+    storage. The browser is relaunched after ``recycle_after`` checkouts to
+    cap native memory growth. Use ``get_browser_manager()`` to obtain the
+    module-level instance; it is closed automatically at interpreter exit.
+
+    With ``user_data_dir`` configured, a single persistent context is launched
+    instead so Chromium's disk cache survives between runs; checkouts then get
+    a fresh page in that shared context rather than a fresh context.
+    """
 
     def __init__(self, config=BROWSER_CONFIG):
         self.config = config
@@ -45,21 +186,64 @@ class BrowserManager:
         self._browser = None
         self._context = None
         self._page = None
+        self._checkouts = 0
 
-    def __enter__(self):
-        self._play = sync_playwright().start()
-        # Use chromium; Playwright bundles compatible browsers (install via 'playwright install --with-deps chromium')
-        self._browser = self._play.chromium.launch(headless=self.config.get("headless", True))
+    def _ensure_started(self):
+        if self._play is None:
+            from playwright.sync_api import sync_playwright
+            self._play = sync_playwright().start()
+        if self._browser is None:
+            # Use chromium; Playwright bundles compatible browsers (install via 'playwright install --with-deps chromium')
+            user_data_dir = self.config.get("user_data_dir")
+            if user_data_dir:
+                # A persistent context stands in for the browser and is shared by all checkouts
+                self._browser = self._play.chromium.launch_persistent_context(
+                    user_data_dir, headless=self.config.get("headless", True), **self._context_options())
+                self._browser.route("**/*", _route_skip_assets)
+            else:
+                self._browser = self._play.chromium.launch(headless=self.config.get("headless", True))
+            self._checkouts = 0
+
+    def _context_options(self):
         width, height = (int(x) for x in self.config.get("window_size", "1920,1080").split(','))
-        self._context = self._browser.new_context(
-            user_agent=self.config.get("user_agent"),
-            viewport={"width": width, "height": height},
-            java_script_enabled=True,
-        )
-        self._page = self._context.new_page()
-        return self._page
+        return {
+            "user_agent": self.config.get("user_agent"),
+            "viewport": {"width": width, "height": height},
+            "java_script_enabled": True,
+        }
+
+    def _new_context(self):
+        self._ensure_started()
+        context = self._browser.new_context(**self._context_options())
+        # Only the DOM matters for scraping; skip downloading assets that are never read.
+        # Routing at context level also covers popups and any other pages it opens.
+        context.route("**/*", _route_skip_assets)
+        return context
+
+    def __enter__(self):
+        if self.config.get("user_data_dir"):
+            self._ensure_started()
+            page = self._page = self._browser.new_page()
+        else:
+            self._context = self._new_context()
+            page = self._context.new_page()
+        self._checkouts += 1
+        return page
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._context:
+            self._context.close()
+            self._context = None
+        if self._page:
+            self._page.close()
+            self._page = None
+        if self._browser and self._checkouts >= self.config.get("recycle_after", 100):
+            logger.info(f"Recycling browser after {self._checkouts} checkouts")
+            self._browser.close()
+            self._browser = None
+
+    def close(self):
+        """Tear down any open context, the browser and the Playwright driver."""
         try:
             if self._context:
                 self._context.close()
@@ -68,6 +252,49 @@ class BrowserManager:
         finally:
             if self._play:
                 self._play.stop()
+            self._play = self._browser = self._context = self._page = None
+
+_browser_manager = None
+
+def get_browser_manager():
+    """Return the process-wide BrowserManager, creating it on first use."""
+    global _browser_manager
+    if _browser_manager is None:
+        _browser_manager = BrowserManager()
+        atexit.register(_browser_manager.close)
+    return _browser_manager
+
+@contextlib.contextmanager
+def _atomic_open(filename):
+    """Open a temp file beside filename for binary writing; rename it into place on success.
+
+    A run killed mid-write leaves the previous file intact instead of a truncated one.
+    """
+    path = Path(filename)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        # mkstemp creates 0600; keep the usual permissions of the file being replaced
+        os.chmod(tmp_name, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+def _atomic_write_bytes(filename, data):
+    """Write data to filename atomically (see _atomic_open)."""
+    with _atomic_open(filename) as f:
+        f.write(data)
+
+@functools.lru_cache(maxsize=None)
+def _date_parser():
+    """dateutil's parser module, imported on first use rather than per date."""
+    from dateutil import parser as date_parser
+    return date_parser
 
 class DataPersistence:
     """Handle data persistence and change detection."""
@@ -77,8 +304,7 @@ class DataPersistence:
         """Load previously scraped data."""
         try:
             if Path(filename).exists():
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _json_loads(Path(filename).read_bytes())
         except Exception as e:
             logger.error(f"Error loading previous data: {e}")
         return {}
@@ -87,16 +313,42 @@ class DataPersistence:
     def save_current_data(data, filename='previous_data.json'):
         """Save current data for future comparison."""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
+            _atomic_write_bytes(filename, _json_dumps(data, indent=True))
+        except (OSError, TypeError, ValueError) as e:
+            # I/O failures, or data that cannot be serialised (orjson.JSONEncodeError is a TypeError)
             logger.error(f"Error saving current data: {e}")
     
     @staticmethod
-    def has_data_changed(current_data, previous_data, key='data'):
-        """Check if data has changed since last run."""
+    def content_hash(rows):
+        """BLAKE2b-128 digest of the rows' canonical (key-sorted) JSON."""
+        return hashlib.blake2b(_json_dumps(rows, sort_keys=True), digest_size=16).hexdigest()
+
+    @staticmethod
+    def has_data_changed(current_data, previous_data, key='data', current_hash=None):
+        """Check if data has changed since last run.
+
+        Compares against the stored '<key>_hash' when present; older files
+        without a hash fall back to a full comparison. Pass ``current_hash``
+        when the caller already has content_hash(current_data).
+        """
+        previous_hash = previous_data.get(f"{key}_hash")
+        if previous_hash:
+            return (current_hash or DataPersistence.content_hash(current_data)) != previous_hash
         return current_data != previous_data.get(key, [])
 
+if _HTML_PARSER == 'lxml':
+    _LXML_HREFS = lxml.html.etree.XPath('.//a/@href', smart_strings=False)
+    # Text and tail nodes in document order; comment content is not a text node
+    _LXML_TEXTS = lxml.html.etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+def _lxml_text(element):
+    """Text of an lxml element, matching BeautifulSoup's get_text(strip=True).
+
+    Each text node is stripped and the pieces joined; comments and
+    script/style contents are skipped as BeautifulSoup does.
+    """
+    return ''.join(t.strip() for t in _LXML_TEXTS(element))
+
 class GAIInsightsScraper:
     """Scraper for GAI Insights table data."""
     
@@ -109,32 +361,122 @@ class GAIInsightsScraper:
         """Scrape table data from GAI Insights."""
         logger.info(f"Starting GAI Insights scraping from {self.url}")
         
-        with BrowserManager() as page:
+        with get_browser_manager() as page:
             return self._scrape_with_page(page)
     
     def _scrape_with_page(self, page):
         """Internal method to scrape with a Playwright page."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         try:
             logger.info("Navigating to page via Playwright")
             page.goto(self.url, timeout=self.config["page_load_timeout"] * 1000, wait_until="domcontentloaded")
 
-            # Allow additional JS-driven population
-            time.sleep(self.config["dynamic_content_wait"])
-
-            # Try waiting specifically for table rows
+            # Wait for the JS-populated rows rather than sleeping a fixed time
             try:
-                page.wait_for_selector(f"#{self.table_id} tbody tr", timeout=45_000)
-                time.sleep(2)
+                page.wait_for_function(_TABLE_ROWS_READY_JS, arg=self.table_id, timeout=45_000)
+                # Let in-flight requests settle so late rows land, bounded by dynamic_content_wait
+                try:
+                    page.wait_for_load_state("networkidle", timeout=self.config["dynamic_content_wait"] * 1000)
+                except PlaywrightTimeoutError:
+                    pass
             except PlaywrightTimeoutError:
                 logger.warning("Table rows not immediately found, proceeding with current DOM...")
 
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            table_data = self._evaluate_table_data(page)
+            if table_data is not None:
+                return table_data
+
+            # Fallback: parse the rendered HTML (also reports a missing table)
+            html = self._table_html(page)
+            if _HTML_PARSER == 'lxml':
+                return self._extract_table_data_lxml(html)
+            # Only build a tree for the target table
+            strainer = SoupStrainer('table', id=self.table_id)
+            soup = BeautifulSoup(html, _HTML_PARSER, parse_only=strainer)
             return self._extract_table_data(soup)
         except Exception as e:
             logger.error(f"Error during GAI scraping: {e}")
             raise RSSScraperError(f"GAI scraping failed: {e}")
     
+    def _table_html(self, page):
+        """Serialised target table only, or the whole page if it cannot be isolated."""
+        from playwright.sync_api import Error as PlaywrightError
+        try:
+            html = page.evaluate(_TABLE_HTML_JS, self.table_id)
+        except PlaywrightError as e:
+            logger.warning(f"Could not read table markup in-page, using full page content: {e}")
+            html = None
+        return html or page.content()
+
+    def _evaluate_table_data(self, page):
+        """Extract table data inside the browser; returns None if unavailable."""
+        from playwright.sync_api import Error as PlaywrightError
+        try:
+            result = page.evaluate(_TABLE_EXTRACT_JS, self.table_id)
+        except PlaywrightError as e:
+            logger.warning(f"In-page table extraction failed, falling back to HTML parsing: {e}")
+            return None
+        if result is None:
+            return None
+
+        headers = tuple(map(sys.intern, result['headers']))
+        table_data = []
+        for cells in result['rows']:
+            if not cells:
+                continue
+            row_data = {}
+            for i, (cell_text, links) in enumerate(cells):
+                header = headers[i] if i < len(headers) else f"Column_{i+1}"
+                row_data[header] = {
+                    'text': cell_text,
+                    'links': links
+                }
+            if any(data['text'] or data['links'] for data in row_data.values()):
+                table_data.append(row_data)
+
+        logger.info(f"Successfully extracted {len(table_data)} rows from GAI table")
+        return table_data
+
+    def _extract_table_data_lxml(self, html):
+        """Extract data from the HTML table with lxml XPath.
+
+        Same traversal and output as _extract_table_data, without building a soup.
+        """
+        tables = lxml.html.document_fromstring(html).xpath('//table[@id=$tid]', tid=self.table_id)
+        if not tables:
+            raise RSSScraperError(f"Table with ID '{self.table_id}' not found")
+        table = tables[0]
+
+        header_row = table.xpath('(.//thead)[1]') or table.xpath('(.//tr)[1]')
+        headers = tuple(sys.intern(_lxml_text(th)) for th in header_row[0].xpath('.//th|.//td')) if header_row else ()
+
+        tbody = table.xpath('(.//tbody)[1]')
+        rows = tbody[0].xpath('.//tr') if tbody else table.xpath('.//tr')[1:]
+
+        table_data = []
+        keys = headers
+        for row in rows:
+            cells = row.xpath('.//td|.//th')
+            if not cells:
+                continue
+            if len(cells) > len(keys):
+                keys += tuple(f"Column_{i+1}" for i in range(len(keys), len(cells)))
+
+            row_data = {
+                key: {
+                    'text': _lxml_text(cell),
+                    'links': _LXML_HREFS(cell)
+                }
+                for key, cell in zip(keys, cells)
+            }
+
+            # Only add rows with content
+            if any(data['text'] or data['links'] for data in row_data.values()):
+                table_data.append(row_data)
+
+        logger.info(f"Successfully extracted {len(table_data)} rows from GAI table")
+        return table_data
+
     def _extract_table_data(self, soup):
         """Extract data from the HTML table."""
         table = soup.find('table', id=self.table_id)
@@ -144,31 +486,32 @@ class GAIInsightsScraper:
         # Extract headers
         headers_row = table.find('thead')
         if headers_row:
-            headers = [th.get_text(strip=True) for th in headers_row.find_all(['th', 'td'])]
+            headers = tuple(sys.intern(th.get_text(strip=True)) for th in headers_row.find_all(['th', 'td']))
         else:
             first_row = table.find('tr')
-            headers = [th.get_text(strip=True) for th in first_row.find_all(['th', 'td'])] if first_row else []
+            headers = tuple(sys.intern(th.get_text(strip=True)) for th in first_row.find_all(['th', 'td'])) if first_row else ()
         
         # Extract rows
         tbody = table.find('tbody')
         rows = tbody.find_all('tr') if tbody else table.find_all('tr')[1:]
         
         table_data = []
+        keys = headers
         for row in rows:
             cells = row.find_all(['td', 'th'])
             if not cells:
                 continue
+            if len(cells) > len(keys):
+                # Cells beyond the header row get Column_N names; extend the key tuple once
+                keys += tuple(f"Column_{i+1}" for i in range(len(keys), len(cells)))
             
-            row_data = {}
-            for i, cell in enumerate(cells):
-                header = headers[i] if i < len(headers) else f"Column_{i+1}"
-                cell_text = cell.get_text(strip=True)
-                links = [a.get('href') for a in cell.find_all('a', href=True)]
-                
-                row_data[header] = {
-                    'text': cell_text,
-                    'links': links
+            row_data = {
+                key: {
+                    'text': cell.get_text(strip=True),
+                    'links': [a['href'] for a in cell.find_all('a', href=True)]
                 }
+                for key, cell in zip(keys, cells)
+            }
             
             # Only add rows with content
             if any(data['text'] or data['links'] for data in row_data.values()):
@@ -177,6 +520,112 @@ class GAIInsightsScraper:
         logger.info(f"Successfully extracted {len(table_data)} rows from GAI table")
         return table_data
 
+def _iter_rss_items(source):
+    """Yield each <item> of an RSS document (path or binary file object), cleared once consumed.
+
+    Uses lxml's C parser, with entity resolution and network access disabled,
+    when available; otherwise the stdlib ElementTree parser.
+    """
+    if lxml_etree is not None:
+        events = lxml_etree.iterparse(source, events=('end',), tag='item',
+                                      resolve_entities=False, no_network=True)
+    else:
+        events = ((event, elem) for event, elem in ET.iterparse(source, events=('end',))
+                  if elem.tag == 'item')
+    for _, elem in events:
+        yield elem
+        elem.clear()
+
+def _make_fg(title, link, description, generator):
+    """FeedGenerator with the channel metadata shared by every feed we write."""
+    from feedgen.feed import FeedGenerator
+    fg = FeedGenerator()
+    fg.title(title)
+    fg.link(href=link, rel='alternate')
+    fg.description(description)
+    fg.language('en')
+    fg.lastBuildDate(datetime.now(timezone.utc))
+    fg.generator(generator)
+    return fg
+
+_RSS_HEAD = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n'
+    '  <channel>\n'
+)
+_RSS_TAIL = '  </channel>\n</rss>\n'
+
+def _xml_text(value):
+    """Escape text for an XML element, dropping characters XML 1.0 cannot carry."""
+    return xml_escape(_XML_INVALID_RE.sub('', value), {'\r': '&#13;'})
+
+def _render_rss_item(entry):
+    """Render one <item> the way feedgen's pretty printer lays it out inside <channel>.
+
+    Empty elements are omitted. pubDate may be a datetime or an already
+    formatted RFC 2822 string (as read back from an existing feed).
+    """
+    parts = ['    <item>\n']
+    if entry.get('title'):
+        parts.append(f"      <title>{_xml_text(entry['title'])}</title>\n")
+    if entry.get('link'):
+        parts.append(f"      <link>{_xml_text(entry['link'])}</link>\n")
+    if entry.get('description'):
+        parts.append(f"      <description>{_xml_text(entry['description'])}</description>\n")
+    if entry.get('guid'):
+        parts.append(f"      <guid isPermaLink=\"false\">{_xml_text(entry['guid'])}</guid>\n")
+    pub_date = entry.get('pubDate')
+    if pub_date:
+        if isinstance(pub_date, datetime):
+            pub_date = format_datetime(pub_date)
+        parts.append(f"      <pubDate>{_xml_text(pub_date)}</pubDate>\n")
+    parts.append('    </item>\n')
+    return ''.join(parts)
+
+def _iter_rss(title, link, description, generator, entries):
+    """Yield an RSS 2.0 feed in chunks, with the same layout as feedgen's rss_str(pretty=True).
+
+    Like feedgen, the last entry added is written first. Unlike feedgen, text
+    with XML-invalid characters is cleaned rather than failing the whole feed.
+    """
+    yield ''.join((
+        _RSS_HEAD,
+        f"    <title>{_xml_text(title)}</title>\n",
+        f"    <link>{_xml_text(link)}</link>\n",
+        f"    <description>{_xml_text(description)}</description>\n",
+        "    <docs>http://www.rssboard.org/rss-specification</docs>\n",
+        f"    <generator>{_xml_text(generator)}</generator>\n",
+        "    <language>en</language>\n",
+        f"    <lastBuildDate>{format_datetime(datetime.now(timezone.utc))}</lastBuildDate>\n",
+    ))
+    yield from map(_render_rss_item, reversed(entries))
+    yield _RSS_TAIL
+
+def _write_feed(filename, title, link, description, generator, entries):
+    """Write a feed of entry dicts (guid/title/link/description/pubDate).
+
+    Uses the direct emitter; set LEGACY_FEEDGEN=1 to build it with FeedGenerator instead.
+    """
+    if os.getenv('LEGACY_FEEDGEN', '0') == '1':
+        fg = _make_fg(title, link, description, generator)
+        for entry in entries:
+            try:
+                fe = fg.add_entry()
+                fe.id(entry['guid'])
+                fe.title(entry['title'])
+                fe.description(entry['description'])
+                fe.link(href=entry['link'])
+                if entry['pubDate']:
+                    fe.pubDate(entry['pubDate'])
+            except Exception as e:
+                logger.error(f"Error adding feed entry {entry.get('guid')}: {e}")
+        _atomic_write_bytes(filename, fg.rss_str(pretty=True))
+        return
+    # Items go straight to the (buffered) file as they are rendered; the document is never held whole
+    with _atomic_open(filename) as f:
+        for chunk in _iter_rss(title, link, description, generator, entries):
+            f.write(chunk.encode('utf-8'))
+
 class RSSGenerator:
     """Generate RSS feeds from scraped data."""
     
@@ -189,145 +638,239 @@ class RSSGenerator:
         - Move older rows into an archive feed file (appended, de-duplicated by GUID).
         - If dates are unparsable, treat as current run (remain in main feed).
         """
-        metadata = RSS_METADATA["gai"]
-        main_filename = RSS_FEED_FILES["gai"]
-        archive_filename = RSS_FEED_FILES.get("gai_archive", "ai_rss_feed_archive.xml")
-
-        cutoff = datetime.now(timezone.utc).date().toordinal() - 60  # ordinal comparison for speed
+        cutoff = datetime.now(timezone.utc).toordinal() - 60  # ordinal comparison for speed
         recent_rows = []
         archive_rows = []
+        columns = RSSGenerator._resolve_columns(table_data[0].keys()) if table_data else None
+        if table_data and not columns:
+            logger.info("GAI table headers not recognised; identifying columns by content")
 
-        # First pass: classify rows by date (if parseable)
+        # First pass: extract fields, GUID and date once per row, then classify by date (if parseable)
         for row in table_data:
-            date_val, rating_val, title_val, title_url, desc_val = RSSGenerator._extract_row_data(row)
+            fields = RSSGenerator._extract_row_data(row, columns)
+            date_val, rating_val, title_val, title_url, desc_val = fields
+            content_for_id = '|'.join((date_val, rating_val, title_val, desc_val))
             parsed_dt = RSSGenerator._parse_date(date_val)
-            if parsed_dt:
-                if parsed_dt.date().toordinal() >= cutoff:
-                    recent_rows.append(row)
-                else:
-                    archive_rows.append(row)
+            prepared = (fields, parsed_dt, content_for_id, RSSGenerator._entry_id(content_for_id))
+            if parsed_dt and parsed_dt.toordinal() < cutoff:
+                archive_rows.append(prepared)
             else:
-                # Keep in recent if date unknown
-                recent_rows.append(row)
+                # Recent, or date unknown
+                recent_rows.append(prepared)
 
         logger.info(f"Retention split: {len(recent_rows)} recent rows, {len(archive_rows)} to archive (from {len(table_data)} total)")
 
         # Generate main feed
         try:
-            fg = FeedGenerator()
-            fg.title(metadata["title"])
-            fg.link(href=metadata["link"], rel='alternate')
-            fg.description(metadata["description"])
-            fg.language('en')
-            fg.lastBuildDate(datetime.now(timezone.utc))
-            fg.generator('GitHub Action RSS Scraper v2.1 (retention)')
-
-            for i, row_data in enumerate(recent_rows):
-                try:
-                    fe = fg.add_entry()
-                    date_val, rating_val, title_val, title_url, desc_val = RSSGenerator._extract_row_data(row_data)
-                    rss_title = title_val or f"Entry {i+1}"
-                    if rating_val and rating_val.lower() in RATING_TAGS:
-                        rss_title += RATING_TAGS[rating_val.lower()]
-                    content_for_id = f"{date_val}|{rating_val}|{title_val}|{desc_val}"
-                    entry_id = hashlib.md5(content_for_id.encode()).hexdigest()
-                    fe.id(entry_id)
-                    fe.title(rss_title)
-                    fe.description(desc_val or title_val)
-                    fe.link(href=title_url or metadata["link"])
-                    pub_date = RSSGenerator._parse_date(date_val) or datetime.now(timezone.utc)
-                    fe.pubDate(pub_date)
-                except Exception as e:
-                    logger.error(f"Error processing recent GAI entry {i+1}: {e}")
-            with open(main_filename, 'wb') as f:
-                f.write(fg.rss_str(pretty=True))
-            logger.info(f"GAI RSS feed written: {main_filename} ({len(recent_rows)} entries)")
+            now = datetime.now(timezone.utc)
+            entries = [
+                RSSGenerator._build_entry_fields(fields, parsed_dt or now, entry_id, f"Entry {i+1}")
+                for i, (fields, parsed_dt, content_for_id, entry_id) in enumerate(recent_rows)
+            ]
+            _write_feed(_GAI_MAIN, _GAI_META["title"], _GAI_META["link"], _GAI_META["description"],
+                        'GitHub Action RSS Scraper v2.1 (retention)', entries)
+            logger.info(f"GAI RSS feed written: {_GAI_MAIN} ({len(recent_rows)} entries)")
         except Exception as e:
             logger.error(f"Error generating main GAI RSS feed: {e}")
             raise RSSScraperError(f"GAI RSS generation failed: {e}")
 
-        # Archive handling: load existing archive entries (if file exists) then append new ones and write out
+        # Archive handling: splice only the new items into the top of the existing archive.
+        # A full rebuild is used when there is no archive yet, when it cannot be
+        # parsed/spliced, or when REBUILD_ARCHIVE=1 is set.
         if archive_rows:
             try:
+                rebuild = os.getenv('REBUILD_ARCHIVE', '0') == '1' or not Path(_GAI_ARCHIVE).exists()
                 existing_archive = []
-                if Path(archive_filename).exists():
+                existing_guids = set()
+                if rebuild:
+                    if Path(_GAI_ARCHIVE).exists():
+                        try:
+                            existing_archive = RSSGenerator._load_archive_entries(_GAI_ARCHIVE, _GAI_META['link'])
+                        except Exception as parse_err:
+                            existing_archive = RSSGenerator._recover_archive(_GAI_ARCHIVE, _GAI_META['link'], parse_err)
+                    existing_guids = {a['guid'] for a in existing_archive if a.get('guid')}
+                else:
                     try:
-                        # Lightweight parse: collect existing GUIDs to prevent duplication
-                        from xml.etree import ElementTree as ET
-                        tree = ET.parse(archive_filename)
-                        root = tree.getroot()
-                        for item in root.findall('.//item'):
-                            guid_el = item.find('guid')
-                            title_el = item.find('title')
-                            link_el = item.find('link')
-                            desc_el = item.find('description')
-                            pub_el = item.find('pubDate')
-                            existing_archive.append({
-                                'guid': guid_el.text if guid_el is not None else '',
-                                'title': title_el.text if title_el is not None else '',
-                                'link': link_el.text if link_el is not None else metadata['link'],
-                                'description': desc_el.text if desc_el is not None else '',
-                                'pubDate': pub_el.text if pub_el is not None else ''
-                            })
+                        existing_guids = RSSGenerator._scan_archive_guids(_GAI_ARCHIVE)
                     except Exception as parse_err:
-                        logger.warning(f"Could not parse existing archive (will recreate): {parse_err}")
-
-                existing_guids = {a['guid'] for a in existing_archive if a.get('guid')}
+                        # Rebuild from whatever survives; the damaged file is kept as .bak
+                        existing_archive = RSSGenerator._recover_archive(_GAI_ARCHIVE, _GAI_META['link'], parse_err)
+                        existing_guids = {a['guid'] for a in existing_archive}
+                        rebuild = True
 
-                archive_fg = FeedGenerator()
-                archive_fg.title(metadata["title"] + " (Archive)")
-                archive_fg.link(href=metadata["link"], rel='alternate')
-                archive_fg.description("Archived items older than 60 days from GAI Insights feed")
-                archive_fg.language('en')
-                archive_fg.lastBuildDate(datetime.now(timezone.utc))
-                archive_fg.generator('GitHub Action RSS Scraper v2.1 (archive)')
-
-                # Re-add existing archive entries first (preserve history)
-                for a in existing_archive:
-                    try:
-                        fe = archive_fg.add_entry()
-                        fe.id(a['guid'])
-                        fe.title(a['title'])
-                        fe.description(a['description'])
-                        fe.link(href=a['link'])
-                        if a['pubDate']:
-                            fe.pubDate(a['pubDate'])
-                    except Exception:
+                new_entries = []
+                for fields, parsed_dt, content_for_id, entry_id in archive_rows:
+                    if entry_id in existing_guids or RSSGenerator._legacy_entry_id(content_for_id) in existing_guids:
                         continue
+                    new_entries.append(RSSGenerator._build_entry_fields(fields, parsed_dt, entry_id, "Archived Entry"))
 
-                # Append new archive rows
-                for row_data in archive_rows:
-                    try:
-                        date_val, rating_val, title_val, title_url, desc_val = RSSGenerator._extract_row_data(row_data)
-                        content_for_id = f"{date_val}|{rating_val}|{title_val}|{desc_val}"
-                        entry_id = hashlib.md5(content_for_id.encode()).hexdigest()
-                        if entry_id in existing_guids:
-                            continue
-                        fe = archive_fg.add_entry()
-                        rss_title = title_val or "Archived Entry"
-                        if rating_val and rating_val.lower() in RATING_TAGS:
-                            rss_title += RATING_TAGS[rating_val.lower()]
-                        fe.id(entry_id)
-                        fe.title(rss_title)
-                        fe.description(desc_val or title_val)
-                        fe.link(href=title_url or metadata['link'])
-                        pub_date = RSSGenerator._parse_date(date_val) or datetime.now(timezone.utc)
-                        fe.pubDate(pub_date)
-                    except Exception as e:
-                        logger.error(f"Error archiving row: {e}")
-                        continue
+                if not rebuild:
+                    if not new_entries:
+                        logger.info(f"Archive RSS unchanged: {_GAI_ARCHIVE} (no new entries)")
+                    elif RSSGenerator._append_archive_items(_GAI_ARCHIVE, new_entries):
+                        logger.info(f"Archive RSS appended: {_GAI_ARCHIVE} (added {len(new_entries)}, total entries: {len(existing_guids) + len(new_entries)})")
+                    else:
+                        logger.warning(f"Archive {_GAI_ARCHIVE} is not laid out as expected; rebuilding")
+                        existing_archive = RSSGenerator._load_archive_entries(_GAI_ARCHIVE, _GAI_META['link'])
+                        rebuild = True
 
-                with open(archive_filename, 'wb') as f:
-                    f.write(archive_fg.rss_str(pretty=True))
-                logger.info(f"Archive RSS updated: {archive_filename} (total entries: {len(existing_archive) + len(archive_rows)})")
+                if rebuild:
+                    # Existing archive entries first (preserve history), then the new ones
+                    _write_feed(_GAI_ARCHIVE, _GAI_META["title"] + " (Archive)", _GAI_META["link"],
+                                "Archived items older than 60 days from GAI Insights feed",
+                                'GitHub Action RSS Scraper v2.1 (archive)', existing_archive + new_entries)
+                    logger.info(f"Archive RSS rebuilt: {_GAI_ARCHIVE} (total entries: {len(existing_archive) + len(new_entries)})")
             except Exception as e:
                 logger.error(f"Error updating archive feed: {e}")
         else:
             logger.info("No rows exceeded 60-day retention; archive unchanged.")
     
     @staticmethod
-    def _extract_row_data(row_data):
-        """Extract structured data from a table row."""
+    def _build_entry_fields(fields, pub_date, entry_id, fallback_title):
+        """Feed entry dict for one extracted row (see _extract_row_data)."""
+        date_val, rating_val, title_val, title_url, desc_val = fields
+        return {
+            'guid': entry_id,
+            'title': (title_val or fallback_title) + _RATING_TAGS_LOWER.get(rating_val.lower(), ''),
+            'link': title_url or _GAI_META['link'],
+            'description': desc_val or title_val,
+            'pubDate': pub_date
+        }
+
+    @staticmethod
+    def _scan_archive_guids(archive_filename):
+        """Collect the GUIDs of an existing archive feed without keeping its items around."""
+        guids = set()
+        for elem in _iter_rss_items(archive_filename):
+            guid = elem.findtext('guid')
+            if guid:
+                guids.add(guid)
+        return guids
+
+    @staticmethod
+    def _append_archive_items(archive_filename, entries):
+        """Splice rendered items in ahead of the archive's existing ones.
+
+        New items go first, in the order a rebuild would emit them, and
+        lastBuildDate is refreshed. The rest of the file is streamed across into
+        a temp file that replaces the archive atomically (see _atomic_open).
+        Returns False if the file is not laid out the way _write_feed writes it,
+        so the caller can fall back to a rebuild.
+        """
+        with open(archive_filename, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 4096))
+            if b'  </channel>' not in f.read():
+                return False
+
+            f.seek(0)
+            head = f.read(65536)
+            insert_at = head.find(b'\n    <item>\n')
+            if insert_at >= 0:
+                insert_at += 1
+            else:
+                # Archive with no items yet
+                insert_at = head.find(b'  </channel>')
+                if insert_at < 0:
+                    return False
+            head = head[:insert_at]
+            stamp = format_datetime(datetime.now(timezone.utc)).encode()
+            head = re.sub(rb'<lastBuildDate>[^<]*</lastBuildDate>',
+                          b'<lastBuildDate>' + stamp + b'</lastBuildDate>', head, count=1)
+
+            f.seek(insert_at)
+            with _atomic_open(archive_filename) as out:
+                out.write(head)
+                out.write(''.join(map(_render_rss_item, reversed(entries))).encode('utf-8'))
+                shutil.copyfileobj(f, out)
+        return True
+
+    @staticmethod
+    def _load_archive_entries(archive_filename, default_link):
+        """Stream the items of an existing archive feed.
+
+        Each <item> is cleared once read (see _iter_rss_items), so memory stays
+        bounded by a single item rather than the whole archive DOM.
+        """
+        return [RSSGenerator._archive_entry(elem, default_link) for elem in _iter_rss_items(archive_filename)]
+
+    @staticmethod
+    def _archive_entry(elem, default_link):
+        """Feed entry dict for one <item> read back from an archive."""
+        link = elem.findtext('link')
+        return {
+            'guid': elem.findtext('guid', ''),
+            'title': elem.findtext('title', ''),
+            'link': link if link is not None else default_link,
+            'description': elem.findtext('description', ''),
+            'pubDate': elem.findtext('pubDate', '')
+        }
+
+    @staticmethod
+    def _recover_archive(archive_filename, default_link, error):
+        """Keep a .bak copy of an archive that failed to parse and salvage what items we can.
+
+        With lxml available the file is re-read in recover mode, so a damaged or
+        truncated archive keeps its intact items; without it nothing is salvaged,
+        but the history is still in the .bak file.
+        """
+        backup = archive_filename + '.bak'
+        shutil.copy2(archive_filename, backup)
+        logger.error(f"Could not parse archive {archive_filename} ({error}); copy kept at {backup}")
+        entries = []
+        if lxml_etree is not None:
+            try:
+                parser = lxml_etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+                root = lxml_etree.parse(archive_filename, parser).getroot()
+                if root is not None:
+                    entries = [RSSGenerator._archive_entry(elem, default_link) for elem in root.iter('item')]
+            except Exception as e:
+                logger.warning(f"Could not recover items from {archive_filename}: {e}")
+        # A truncated final item has no GUID to dedupe on; drop it
+        entries = [e for e in entries if e['guid']]
+        logger.warning(f"Recovered {len(entries)} items from {archive_filename}")
+        return entries
+
+    @staticmethod
+    def _entry_id(content_for_id):
+        """Stable entry GUID: BLAKE2b-128 hex digest of the entry's content key."""
+        return hashlib.blake2b(content_for_id.encode(), digest_size=16, usedforsecurity=False).hexdigest()
+
+    @staticmethod
+    def _legacy_entry_id(content_for_id):
+        """MD5 GUID used before the BLAKE2b switch; still matched when de-duplicating the archive."""
+        return hashlib.md5(content_for_id.encode(), usedforsecurity=False).hexdigest()
+
+    @staticmethod
+    def _resolve_columns(headers):
+        """Map each column role to its header by name, or None if any role is missing."""
+        columns = {}
+        for header in headers:
+            name = header.lower()
+            for role, names in _COLUMN_ROLES:
+                if role not in columns and name in names:
+                    columns[role] = header
+                    break
+        return columns if len(columns) == len(_COLUMN_ROLES) else None
+
+    @staticmethod
+    def _extract_row_data(row_data, columns=None):
+        """Extract structured data from a table row.
+
+        With a resolved column map (see _resolve_columns) the fields are looked
+        up directly; otherwise each cell is classified by its content.
+        """
+        if columns:
+            title_cell = row_data.get(columns['title'], _EMPTY_CELL)
+            title_links = title_cell.get('links')
+            return (
+                row_data.get(columns['date'], _EMPTY_CELL).get('text', '').strip(),
+                row_data.get(columns['rating'], _EMPTY_CELL).get('text', '').strip(),
+                title_cell.get('text', '').strip(),
+                title_links[0] if title_links else "",
+                row_data.get(columns['desc'], _EMPTY_CELL).get('text', '').strip(),
+            )
+
         columns = list(row_data.items())
         
         date_value = ""
@@ -336,19 +879,27 @@ class RSSGenerator:
         title_url = ""
         description_value = ""
         
-        for col_name, col_data in columns:
+        for i, (col_name, col_data) in enumerate(columns):
+            if date_value and rating_value and title_value:
+                # Only the description is left; it takes the longest remaining text
+                for _, rest in columns[i:]:
+                    rest_text = rest.get('text', '').strip()
+                    if len(rest_text) > len(description_value):
+                        description_value = rest_text
+                break
             col_text = col_data.get('text', '').strip()
             col_links = col_data.get('links', [])
+            col_name_lower = col_name.lower()
             
             # Identify columns by content
-            if not date_value and (col_name.lower() in ['date', 'published', 'time'] or 
-                                 any(char.isdigit() for char in col_text[:10])):
+            if not date_value and (col_name_lower in _DATE_HEADERS or
+                                 _DIGIT_RE.search(col_text, 0, 10)):
                 date_value = col_text
-            elif not rating_value and (col_name.lower() in ['rating', 'score'] or 
-                                      col_text.lower() in ['essential', 'important', 'optional']):
+            elif not rating_value and (col_name_lower in _RATING_HEADERS or
+                                      col_text.lower() in _RATING_VALUES):
                 rating_value = col_text
-            elif not title_value and (col_links or (len(col_text) > 10 and 
-                                                   col_name.lower() not in ['rating', 'score'])):
+            elif not title_value and (col_links or (len(col_text) > 10 and
+                                                   col_name_lower not in _RATING_HEADERS)):
                 title_value = col_text
                 if col_links:
                     title_url = col_links[0]
@@ -358,22 +909,50 @@ class RSSGenerator:
         return date_value, rating_value, title_value, title_url, description_value
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_date(date_str):
-        """Parse date string to datetime object."""
+        """Parse date string to datetime object.
+
+        Accepts YYYY-MM-DD, then MM/DD/YYYY, then DD/MM/YYYY (the same formats and
+        order the strptime loop used), matched by regex instead of by exception.
+        Other complete spellings (e.g. "Nov 21, 2025") go to dateutil.
+        """
         if not date_str:
             return None
-        
-        try:
-            for date_format in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-                try:
-                    return datetime.strptime(date_str, date_format).replace(tzinfo=timezone.utc)
-                except ValueError:
-                    continue
-        except:
-            pass
-        
+
+        match = _ISO_DATE_RE.fullmatch(date_str)
+        if match:
+            candidates = ((match[1], match[2], match[3]),)
+        else:
+            match = _SLASH_DATE_RE.fullmatch(date_str)
+            if not match:
+                return RSSGenerator._parse_free_date(date_str)
+            candidates = ((match[3], match[1], match[2]), (match[3], match[2], match[1]))
+
+        for year, month, day in candidates:
+            try:
+                return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+            except ValueError:
+                continue
         return None
 
+    @staticmethod
+    def _parse_free_date(date_str):
+        """dateutil fallback for other date spellings; naive results are taken as UTC.
+
+        Strings missing a year, month or day (e.g. "12" or "Nov 21") are rejected
+        rather than completed from a default date: they are parsed against two
+        different defaults and must come out the same.
+        """
+        date_parser = _date_parser()
+        try:
+            parsed = date_parser.parse(date_str, default=_DATE_DEFAULT_A)
+            if parsed.date() != date_parser.parse(date_str, default=_DATE_DEFAULT_B).date():
+                return None
+        except (ValueError, OverflowError):
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 # ---------------- Aggregator Utilities ---------------- #
 
 def load_aggregator_configs():
@@ -443,6 +1022,38 @@ def load_aggregator_config():
     return configs[0] if configs else dict(AGGREGATED_DEFAULT)
 
 AGG_CACHE_FILE = 'aggregator_cache.json'
+
+# In-process DNS cache: aggregation hits the same hosts repeatedly (retries,
+# several feeds per domain), so memoize getaddrinfo results for a while.
+_DNS_CACHE_TTL = 900
+_DNS_CACHE_MAXSIZE = 256
+_dns_cache = OrderedDict()
+_dns_cache_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        hit = _dns_cache.get(key)
+        if hit and hit[0] > now:
+            _dns_cache.move_to_end(key)
+            return hit[1]
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + _DNS_CACHE_TTL, result)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > _DNS_CACHE_MAXSIZE:
+            _dns_cache.popitem(last=False)
+    return result
+
+def _install_dns_cache():
+    """Route socket.getaddrinfo (used by requests/urllib3) through the TTL cache."""
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+
+_install_dns_cache()
+
 _USER_AGENTS = [
     # A small rotating pool of realistic desktop browser UA strings
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
@@ -451,42 +1062,67 @@ _USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0'
 ]
 
+def _new_http_session(pool_size=32):
+    """Build a keep-alive Session whose connection pool is shared by every source fetch."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
 def _load_agg_cache():
     try:
         if Path(AGG_CACHE_FILE).exists():
-            with open(AGG_CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(Path(AGG_CACHE_FILE).read_bytes())
     except Exception as e:
         logger.warning(f"Failed to load aggregator cache: {e}")
     return { 'sources': {}, 'domain_last_fetch': {} }
 
 def _save_agg_cache(cache):
+    """Write the cache atomically, leaving the file alone when its contents would not change."""
     try:
-        with open(AGG_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
+        data = _json_dumps(cache, indent=True)
+        cache_path = Path(AGG_CACHE_FILE)
+        if cache_path.exists() and cache_path.read_bytes() == data:
+            return
+        _atomic_write_bytes(AGG_CACHE_FILE, data)
     except Exception as e:
         logger.warning(f"Failed to save aggregator cache: {e}")
 
+_domain_slots_lock = threading.Lock()
+
 def polite_delay(policy, domain, cache):
-    now = time.time()
-    domain_times = cache.setdefault('domain_last_fetch', {})
-    last = domain_times.get(domain, 0)
+    """Sleep until this fetch's slot for ``domain``.
+
+    Slots are reserved under a lock, so concurrent workers hitting the same
+    domain queue up at least ``per_domain_min_interval`` seconds apart.
+    """
     min_interval = policy.get('per_domain_min_interval', 10)
-    wait_needed = last + min_interval - now
-    if wait_needed > 0:
-        sleep_time = min(wait_needed, min_interval)
-        logger.info(f"Respecting per-domain interval for {domain}: sleeping {sleep_time:.2f}s")
-        time.sleep(sleep_time)
     # Random base inter-request delay
     base_delay = random.uniform(policy.get('min_delay', 1.0), policy.get('max_delay', 3.0))
-    time.sleep(base_delay)
-    domain_times[domain] = time.time()
+    with _domain_slots_lock:
+        domain_times = cache.setdefault('domain_last_fetch', {})
+        now = time.time()
+        last = domain_times.get(domain, 0)
+        fetch_at = max(now, last + min_interval) + base_delay
+        domain_times[domain] = fetch_at
+    sleep_for = fetch_at - now
+    logger.info(f"Polite delay for {domain}: sleeping {sleep_for:.2f}s")
+    time.sleep(sleep_for)
 
-def fetch_rss(url, policy, cache):
+def fetch_rss(url, policy, cache, session=None, domain=None):
     """Fetch RSS politely with rotating UA, conditional requests, retries, backoff, and pacing.
 
+    Pass a shared ``session`` (see ``_new_http_session``) to reuse pooled
+    keep-alive connections across sources, and ``domain`` when the caller
+    has already parsed the URL's hostname.
     Returns list of items (dict) or empty list on failure/304.
     """
+    if session is None:
+        # One-off call: use a throwaway session and close its connections afterwards
+        with _new_http_session(pool_size=1) as session:
+            return fetch_rss(url, policy, cache, session, domain)
     src_meta = cache.setdefault('sources', {}).setdefault(url, {})
     # Failure tracking (persisted in cache file):
     #   consecutive_failures: int
@@ -505,7 +1141,6 @@ def fetch_rss(url, policy, cache):
         'User-Agent': random.choice(_USER_AGENTS),
         'Accept': 'application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.7',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Connection': 'close',
         'Cache-Control': 'no-cache'
     }
     # Conditional headers
@@ -518,12 +1153,12 @@ def fetch_rss(url, policy, cache):
     back_base = policy.get('retry_backoff_base', 2)
     jitter = policy.get('retry_jitter', 0.5)
     timeout = policy.get('timeout', 25)
-    domain = urlparse(url).hostname or 'unknown'
+    if domain is None:
+        domain = urlparse(url).hostname or 'unknown'
 
     polite_delay(policy, domain, cache)
 
     last_err = None
-    session = requests.Session()
     for attempt in range(1, attempts + 1):
         try:
             resp = session.get(url, headers=headers, timeout=timeout)
@@ -541,19 +1176,14 @@ def fetch_rss(url, policy, cache):
                 src_meta['etag'] = resp.headers['ETag']
             if 'Last-Modified' in resp.headers:
                 src_meta['last_modified'] = resp.headers['Last-Modified']
-            content = resp.content
-            root = ET.fromstring(content)
-            channel = root.find('channel') or root
+            # Stream the items, clearing each once read, instead of building the whole DOM
             items = []
-            for item in channel.findall('.//item'):
-                def _text(tag):
-                    el = item.find(tag)
-                    return el.text.strip() if el is not None and el.text else ''
+            for elem in _iter_rss_items(io.BytesIO(resp.content)):
                 items.append({
-                    'title': _text('title'),
-                    'link': _text('link'),
-                    'description': _text('description') or _text('summary'),
-                    'pubDate': _text('pubDate')
+                    'title': (elem.findtext('title') or '').strip(),
+                    'link': (elem.findtext('link') or '').strip(),
+                    'description': (elem.findtext('description') or '').strip() or (elem.findtext('summary') or '').strip(),
+                    'pubDate': (elem.findtext('pubDate') or '').strip()
                 })
             # Success bookkeeping
             src_meta['consecutive_failures'] = 0
@@ -604,11 +1234,15 @@ def parse_pub_date(date_str):
     if not date_str:
         return None
     try:
-        return date_parser.parse(date_str)
+        return _date_parser().parse(date_str)
     except Exception:
         return None
 
-def aggregate_external_feeds(cfg):
+def aggregate_external_feeds(cfg, session=None):
+    """Fetch cfg's sources and write its aggregated feed, archive and health reports.
+
+    Pass a shared ``session`` to reuse pooled connections across aggregator configs.
+    """
     sources = cfg.get('sources', [])
     max_items = int(cfg.get('max_items', 150))
     retention_days = int(cfg.get('retention_days', 60))
@@ -643,13 +1277,32 @@ def aggregate_external_feeds(cfg):
         'timestamp': datetime.now(timezone.utc).isoformat(),
         'details': []
     }
+    own_session = session is None
+    if own_session:
+        session = _new_http_session()
     prune_threshold = int(os.getenv('PRUNE_CONSECUTIVE_THRESHOLD', '3'))
     permanent_classes = {'ssl_error','dns_error'}
     recommended_prune = []
-    for src in shuffled:
+
+    # Parse each source's hostname once; used for pacing and attribution
+    host_map = {src: urlparse(src).hostname for src in shuffled}
+
+    def _fetch_source(src):
         logger.info(f"Fetching source: {src}")
         pre_failures = cache.get('sources', {}).get(src, {}).get('consecutive_failures', 0)
-        items = fetch_rss(src, policy, cache)
+        items = fetch_rss(src, policy, cache, session, host_map[src] or 'unknown')
+        return src, pre_failures, items
+
+    # Fetch concurrently; polite_delay keeps per-domain pacing across workers.
+    try:
+        with ThreadPoolExecutor(max_workers=policy.get('max_workers', 8)) as executor:
+            results = list(executor.map(_fetch_source, shuffled))
+    finally:
+        if own_session:
+            session.close()
+
+    now = datetime.now(timezone.utc)
+    for src, pre_failures, items in results:
         meta = cache.get('sources', {}).get(src, {})
         if meta.get('skipped'):
             health['skipped'] += 1
@@ -660,11 +1313,11 @@ def aggregate_external_feeds(cfg):
             health['with_items'] += 1
             if pre_failures and meta.get('consecutive_failures', 0) == 0:
                 health['recovered'] += 1
-            logger.info(f"  Retrieved {len(items)} items")
+            logger.info(f"  Retrieved {len(items)} items from {src}")
         else:
             if meta.get('consecutive_failures', 0) > 0:
                 health['failures'] += 1
-            logger.info("  No items returned")
+            logger.info(f"  No items returned from {src}")
         classification = meta.get('last_classification') or ('ok' if items else 'empty')
         cf = meta.get('consecutive_failures', 0)
         if (classification in permanent_classes and cf >= 1) or cf >= prune_threshold:
@@ -678,11 +1331,11 @@ def aggregate_external_feeds(cfg):
             'last_status': meta.get('last_status'),
             'classification': classification
         })
-        src_host = urlparse(src).hostname or 'source'
+        src_host = host_map[src] or 'source'
         for it in items:
-            dt = parse_pub_date(it.get('pubDate')) or datetime.now(timezone.utc)
+            dt = parse_pub_date(it.get('pubDate')) or now
             guid_basis = f"{it.get('title')}|{it.get('link')}|{dt.isoformat()}"
-            guid = hashlib.md5(guid_basis.encode()).hexdigest()
+            guid = RSSGenerator._entry_id(guid_basis)
             title_text = it.get('title') or 'Untitled'
             description_text = it.get('description') or ''
             if source_attr == 'title':
@@ -694,18 +1347,23 @@ def aggregate_external_feeds(cfg):
                 'link': it.get('link') or cfg.get('link'),
                 'description': description_text,
                 'pubDate': dt,
-                'guid': guid
+                'guid': guid,
+                'guid_basis': guid_basis
             })
-        time.sleep(1)  # polite throttle
 
-    # Deduplicate by GUID
-    unique = {c['guid']: c for c in collected}.values()
+    # Deduplicate by GUID, keeping the first occurrence
+    seen = set()
+    unique = []
+    for c in collected:
+        if c['guid'] not in seen:
+            seen.add(c['guid'])
+            unique.append(c)
     # Split by retention
-    cutoff_ord = (datetime.now(timezone.utc).date().toordinal() - retention_days)
+    cutoff_ord = now.toordinal() - retention_days
     recent = []
     archive_additions = []
     for entry in unique:
-        if entry['pubDate'].date().toordinal() >= cutoff_ord:
+        if entry['pubDate'].toordinal() >= cutoff_ord:
             recent.append(entry)
         else:
             archive_additions.append(entry)
@@ -713,83 +1371,54 @@ def aggregate_external_feeds(cfg):
     # Sort & trim recent
     recent_sorted = sorted(recent, key=lambda x: x['pubDate'], reverse=True)[:max_items]
     logger.info(f"Writing {len(recent_sorted)} recent aggregated items; {len(archive_additions)} to archive")
-    fg = FeedGenerator()
-    fg.title(cfg.get('title'))
-    fg.link(href=cfg.get('link'), rel='alternate')
-    fg.description(cfg.get('description'))
-    fg.language('en')
-    fg.lastBuildDate(datetime.now(timezone.utc))
-    fg.generator('GitHub Action RSS Aggregator v2 (retention)')
-    for entry in recent_sorted:
-        fe = fg.add_entry()
-        fe.id(entry['guid'])
-        fe.title(entry['title'])
-        fe.description(entry['description'])
-        fe.link(href=entry['link'])
-        fe.pubDate(entry['pubDate'])
-    with open(output_file, 'wb') as f:
-        f.write(fg.rss_str(pretty=True))
+    _write_feed(output_file, cfg.get('title'), cfg.get('link'), cfg.get('description'),
+                'GitHub Action RSS Aggregator v2 (retention)', recent_sorted)
     logger.info(f"Aggregated feed written: {output_file}")
 
-    # Archive update
+    # Archive update: splice only the new items into the existing file, as the GAI
+    # archive does; rebuild when there is no archive yet, it cannot be
+    # parsed/spliced, or REBUILD_ARCHIVE=1 is set.
     if archive_additions:
         try:
+            rebuild = os.getenv('REBUILD_ARCHIVE', '0') == '1' or not Path(archive_file).exists()
             existing = []
             existing_guids = set()
-            if Path(archive_file).exists():
+            if rebuild:
+                if Path(archive_file).exists():
+                    try:
+                        existing = RSSGenerator._load_archive_entries(archive_file, cfg.get('link'))
+                    except Exception as parse_err:
+                        existing = RSSGenerator._recover_archive(archive_file, cfg.get('link'), parse_err)
+                existing_guids = {e['guid'] for e in existing}
+            else:
                 try:
-                    tree = ET.parse(archive_file)
-                    root = tree.getroot()
-                    for item in root.findall('.//item'):
-                        guid_el = item.find('guid')
-                        title_el = item.find('title')
-                        link_el = item.find('link')
-                        desc_el = item.find('description')
-                        pub_el = item.find('pubDate')
-                        guid_val = guid_el.text if guid_el is not None else ''
-                        existing_guids.add(guid_val)
-                        existing.append({
-                            'guid': guid_val,
-                            'title': title_el.text if title_el is not None else '',
-                            'link': link_el.text if link_el is not None else cfg.get('link'),
-                            'description': desc_el.text if desc_el is not None else '',
-                            'pubDate': pub_el.text if pub_el is not None else ''
-                        })
+                    existing_guids = RSSGenerator._scan_archive_guids(archive_file)
                 except Exception as parse_err:
-                    logger.warning(f"Could not parse existing aggregated archive; recreating: {parse_err}")
-            archive_fg = FeedGenerator()
-            archive_fg.title(cfg.get('title') + ' (Archive)')
-            archive_fg.link(href=cfg.get('link'), rel='alternate')
-            archive_fg.description('Archived aggregated items older than retention window')
-            archive_fg.language('en')
-            archive_fg.lastBuildDate(datetime.now(timezone.utc))
-            archive_fg.generator('GitHub Action RSS Aggregator v2 (archive)')
-            # Re-add existing
-            for e in existing:
-                if not e.get('guid'):
-                    continue
-                fe = archive_fg.add_entry()
-                fe.id(e['guid'])
-                fe.title(e['title'])
-                fe.description(e['description'])
-                fe.link(href=e['link'])
-                if e['pubDate']:
-                    fe.pubDate(e['pubDate'])
-            # Add new
-            added = 0
-            for entry in archive_additions:
-                if entry['guid'] in existing_guids:
-                    continue
-                fe = archive_fg.add_entry()
-                fe.id(entry['guid'])
-                fe.title(entry['title'])
-                fe.description(entry['description'])
-                fe.link(href=entry['link'])
-                fe.pubDate(entry['pubDate'])
-                added += 1
-            with open(archive_file, 'wb') as f:
-                f.write(archive_fg.rss_str(pretty=True))
-            logger.info(f"Aggregated archive updated: {archive_file} (added {added}, total {len(existing) + added})")
+                    # Rebuild from whatever survives; the damaged file is kept as .bak
+                    existing = RSSGenerator._recover_archive(archive_file, cfg.get('link'), parse_err)
+                    existing_guids = {e['guid'] for e in existing}
+                    rebuild = True
+            # Items archived before the BLAKE2b switch carry MD5 GUIDs
+            new_entries = [entry for entry in archive_additions
+                           if entry['guid'] not in existing_guids
+                           and RSSGenerator._legacy_entry_id(entry['guid_basis']) not in existing_guids]
+            if not rebuild:
+                if not new_entries:
+                    # Everything past retention is already archived; leave the file untouched
+                    logger.info(f"Aggregated archive unchanged: {archive_file} (total {len(existing_guids)})")
+                elif RSSGenerator._append_archive_items(archive_file, new_entries):
+                    logger.info(f"Aggregated archive appended: {archive_file} (added {len(new_entries)}, total {len(existing_guids) + len(new_entries)})")
+                else:
+                    logger.warning(f"Aggregated archive {archive_file} is not laid out as expected; rebuilding")
+                    existing = RSSGenerator._load_archive_entries(archive_file, cfg.get('link'))
+                    rebuild = True
+            if rebuild:
+                # Existing items (minus any without a GUID) followed by the new ones
+                _write_feed(archive_file, cfg.get('title') + ' (Archive)', cfg.get('link'),
+                            'Archived aggregated items older than retention window',
+                            'GitHub Action RSS Aggregator v2 (archive)',
+                            [e for e in existing if e.get('guid')] + new_entries)
+                logger.info(f"Aggregated archive rebuilt: {archive_file} (added {len(new_entries)}, total {len(existing) + len(new_entries)})")
         except Exception as e:
             logger.error(f"Error updating aggregated archive: {e}")
     # Persist cache updates
@@ -797,34 +1426,34 @@ def aggregate_external_feeds(cfg):
     # Write health summary adjacent to output feed for quick inspection
     try:
         health_file = output_file.replace('.xml', '_health.json')
-        with open(health_file, 'w', encoding='utf-8') as hf:
-            json.dump(health, hf, indent=2)
+        _atomic_write_bytes(health_file, _json_dumps(health))
         logger.info(f"Health summary written: {health_file} (attempted {health['attempted']}, skipped {health['skipped']}, failures {health['failures']}, recovered {health['recovered']})")
-        # Markdown report
+        # Markdown report, assembled in memory and written once
         report_file = output_file.replace('.xml', '_report.md')
-        with open(report_file, 'w', encoding='utf-8') as rf:
-            rf.write(f"# Aggregated Feed Health Report: {output_file}\n\n")
-            rf.write(f"Generated: {health['timestamp']} UTC\n\n")
-            rf.write(f"- Total sources: {health['total_sources']}\n")
-            rf.write(f"- Attempted: {health['attempted']}  Skipped: {health['skipped']}  Failures: {health['failures']}  With Items: {health['with_items']}  Recovered: {health['recovered']}\n")
-            rf.write(f"- Prune threshold: {prune_threshold} consecutive failures (permanent classes: ssl_error,dns_error)\n\n")
-            if recommended_prune:
-                rf.write("## Recommended Prune Candidates\n\n")
-                for u in recommended_prune:
-                    meta = cache['sources'].get(u, {})
-                    rf.write(f"- {u} (cf={meta.get('consecutive_failures',0)}, class={meta.get('last_classification')}, last_error={ (meta.get('last_error') or '')[:100] })\n")
-                rf.write('\n')
-            rf.write("## Source Details (first 100)\n\n")
-            rf.write("| URL | Status | Class | CF | Items | Last Status | Error Excerpt |\n")
-            rf.write("|-----|--------|-------|----|-------|-------------|---------------|\n")
-            for d in health['details'][:100]:
-                err_excerpt = (d.get('last_error') or '')[:60].replace('\n',' ')
-                rf.write(f"| {d['url']} | {d['status']} | {d.get('classification','')} | {d['consecutive_failures']} | {d['items']} | {d.get('last_status')} | {err_excerpt} |\n")
+        md_parts = [
+            f"# Aggregated Feed Health Report: {output_file}\n\n",
+            f"Generated: {health['timestamp']} UTC\n\n",
+            f"- Total sources: {health['total_sources']}\n",
+            f"- Attempted: {health['attempted']}  Skipped: {health['skipped']}  Failures: {health['failures']}  With Items: {health['with_items']}  Recovered: {health['recovered']}\n",
+            f"- Prune threshold: {prune_threshold} consecutive failures (permanent classes: ssl_error,dns_error)\n\n",
+        ]
+        if recommended_prune:
+            md_parts.append("## Recommended Prune Candidates\n\n")
+            for u in recommended_prune:
+                meta = cache['sources'].get(u, {})
+                md_parts.append(f"- {u} (cf={meta.get('consecutive_failures',0)}, class={meta.get('last_classification')}, last_error={ (meta.get('last_error') or '')[:100] })\n")
+            md_parts.append('\n')
+        md_parts.append("## Source Details (first 100)\n\n")
+        md_parts.append("| URL | Status | Class | CF | Items | Last Status | Error Excerpt |\n")
+        md_parts.append("|-----|--------|-------|----|-------|-------------|---------------|\n")
+        for d in health['details'][:100]:
+            err_excerpt = (d.get('last_error') or '')[:60].replace('\n',' ')
+            md_parts.append(f"| {d['url']} | {d['status']} | {d.get('classification','')} | {d['consecutive_failures']} | {d['items']} | {d.get('last_status')} | {err_excerpt} |\n")
+        _atomic_write_bytes(report_file, ''.join(md_parts).encode('utf-8'))
         logger.info(f"Markdown report written: {report_file}")
         # Skipped sources summary
         skipped_sources = [u for u,m in cache.get('sources',{}).items() if m.get('skipped')]
-        with open('skipped_sources.json','w',encoding='utf-8') as sf:
-            json.dump({ 'generated': health['timestamp'], 'skip_threshold': policy.get('skip_after_failures'), 'sources': skipped_sources }, sf, indent=2)
+        _atomic_write_bytes('skipped_sources.json', _json_dumps({ 'generated': health['timestamp'], 'skip_threshold': policy.get('skip_after_failures'), 'sources': skipped_sources }))
         logger.info("Skipped sources summary written: skipped_sources.json")
     except Exception as he:
         logger.warning(f"Failed to write health summary: {he}")
@@ -848,14 +1477,22 @@ def main():
         
         current_gai_data = gai_scraper.scrape()
         
-        # Check for changes
-        if persistence.has_data_changed(current_gai_data, previous_data, 'gai_data'):
+        # Check for changes (the hash is stored with the data below)
+        current_gai_hash = persistence.content_hash(current_gai_data)
+        changed = persistence.has_data_changed(current_gai_data, previous_data, 'gai_data', current_gai_hash)
+        if changed:
             logger.info("Changes detected in GAI data")
         else:
             logger.info("No changes detected in GAI data")
-        
-        # Generate primary GAI feed
-        RSSGenerator.generate_gai_feed(current_gai_data)
+
+        # Regenerate only when something moved: the data, a missing feed, or a new UTC day
+        # (the 60-day retention cutoff advances daily even if the table does not change)
+        today = datetime.now(timezone.utc).date().isoformat()
+        regenerate = changed or not Path(_GAI_MAIN).exists() or previous_data.get('timestamp', '')[:10] != today
+        if regenerate:
+            RSSGenerator.generate_gai_feed(current_gai_data)
+        else:
+            logger.info(f"GAI feed already current for {today}; skipping regeneration")
 
         # Aggregated external feeds (multi-feed support)
         try:
@@ -863,23 +1500,30 @@ def main():
             if not aggregator_cfgs:
                 logger.info("No aggregated feeds configured")
             else:
-                for cfg in aggregator_cfgs:
-                    if not cfg.get('enabled', True):
-                        logger.info(f"Aggregator '{cfg.get('key')}' disabled")
-                        continue
-                    logger.info("=" * 60)
-                    logger.info(f"AGGREGATING SOURCES FOR FEED: {cfg.get('key')} -> {cfg.get('output')}")
-                    logger.info("=" * 60)
-                    aggregate_external_feeds(cfg)
+                # One connection pool for every aggregated feed; hosts shared between feeds stay warm
+                session = _new_http_session()
+                try:
+                    for cfg in aggregator_cfgs:
+                        if not cfg.get('enabled', True):
+                            logger.info(f"Aggregator '{cfg.get('key')}' disabled")
+                            continue
+                        logger.info("=" * 60)
+                        logger.info(f"AGGREGATING SOURCES FOR FEED: {cfg.get('key')} -> {cfg.get('output')}")
+                        logger.info("=" * 60)
+                        aggregate_external_feeds(cfg, session)
+                finally:
+                    session.close()
         except Exception as agg_err:
             logger.error(f"Aggregator(s) failed: {agg_err}")
         
         # Save current data
-        current_data = {
-            'gai_data': current_gai_data,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-        persistence.save_current_data(current_data)
+        if regenerate:
+            current_data = {
+                'gai_data': current_gai_data,
+                'gai_data_hash': current_gai_hash,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+            persistence.save_current_data(current_data)
         
         logger.info("RSS scraper completed successfully")
         
@@ -888,6 +1532,8 @@ def main():
         import traceback
         traceback.print_exc()
         exit(1)
+    finally:
+        get_browser_manager().close()
 
 if __name__ == "__main__":
     main()
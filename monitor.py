@@ -3,22 +3,50 @@
 Monitoring script to check RSS feed health and send notifications.
 """
 
+import functools
 import json
 import os
-import xml.etree.ElementTree as ET
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-# Attempt dynamic discovery of aggregated feeds
-def _discover_aggregated_outputs():
+# orjson parses/serialises much faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SSL/DNS failures that retrying will not fix; matched against lowercased error text
+_PERM_ERR_RE = re.compile(r'ssl|name or service not known|nodename nor servname|nxdomain|temporary failure in name resolution')
+
+# Prefer lxml's C parser (its ParseError also covers XMLSyntaxError); fall back to the stdlib
+try:
+    from lxml import etree as ET
+    _LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _LXML = False
+
+def _config_mtime():
+    """Modification time of _config.yml (ns), or None if it does not exist."""
+    try:
+        return os.stat('_config.yml').st_mtime_ns
+    except OSError:
+        return None
+
+# Attempt dynamic discovery of aggregated feeds; cached until _config.yml changes
+@functools.lru_cache(maxsize=1)
+def _discover_aggregated_outputs(cfg_mtime):
     outputs = []
+    if cfg_mtime is None:
+        return ()
     try:
         import yaml
-        cfg_path = Path('_config.yml')
-        if not cfg_path.exists():
-            return outputs
-        with open(cfg_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        # The libyaml-backed loader is much faster when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open('_config.yml', 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=loader) or {}
         # Support unified feeds structure
         agg = data.get('aggregated_feeds')
         unified = data.get('feeds')
@@ -28,7 +56,7 @@ def _discover_aggregated_outputs():
             if derived:
                 agg = derived
         if not agg:
-            return outputs
+            return ()
         if isinstance(agg, dict):
             out = agg.get('output') or '/aggregated_external.xml'
             outputs.append(out.lstrip('/'))
@@ -42,7 +70,77 @@ def _discover_aggregated_outputs():
         outputs = list(dict.fromkeys(outputs))
     except Exception:
         pass
-    return outputs
+    return tuple(outputs)
+
+def _check_feed(rss_file):
+    """Check one feed file; returns (feed_status, severity) with severity None, 'warning' or 'error'."""
+    severity = None
+    feed_status = {
+        'exists': False,
+        'valid_xml': False,
+        'entry_count': 0,
+        'last_updated': None,
+        'size_bytes': 0,
+        'errors': []
+    }
+    
+    try:
+        # One stat call answers both "does it exist" and "how big is it"
+        try:
+            size_bytes = os.stat(rss_file).st_size
+        except FileNotFoundError:
+            size_bytes = None
+        if size_bytes is not None:
+            feed_status['exists'] = True
+            feed_status['size_bytes'] = size_bytes
+            
+            # Stream the XML to check validity and count entries; each <item> is
+            # cleared once counted so large archives never sit in memory whole
+            try:
+                entry_count = 0
+                last_build = None
+                if _LXML:
+                    # Only item/lastBuildDate events reach Python; entities and network stay off
+                    events = ET.iterparse(rss_file, events=('end',), tag=('item', 'lastBuildDate'),
+                                          resolve_entities=False, no_network=True)
+                else:
+                    events = ET.iterparse(rss_file, events=('end',))
+                for _, elem in events:
+                    if elem.tag == 'item':
+                        entry_count += 1
+                        elem.clear()
+                    elif elem.tag == 'lastBuildDate':
+                        last_build = elem.text
+                feed_status['valid_xml'] = True
+                feed_status['entry_count'] = entry_count
+                feed_status['last_updated'] = last_build
+                
+                # Check for minimum entries
+                if feed_status['entry_count'] == 0:
+                    feed_status['errors'].append('No entries in RSS feed')
+                    severity = 'warning'
+                elif feed_status['entry_count'] < 5:
+                    feed_status['errors'].append(f'Low entry count: {feed_status["entry_count"]}')
+                    severity = 'warning'
+                    
+            except ET.ParseError as e:
+                feed_status['errors'].append(f'Invalid XML: {str(e)}')
+                severity = 'error'
+                
+        else:
+            # Treat missing archives as warning, primary feeds as error
+            if rss_file.endswith('_archive.xml'):
+                feed_status['errors'].append('Archive not yet created')
+                severity = 'warning'
+            else:
+                feed_status['errors'].append('RSS file does not exist')
+                severity = 'error'
+            
+    except Exception as e:
+        feed_status['errors'].append(f'Unexpected error: {str(e)}')
+        severity = 'error'
+    
+    return feed_status, severity
 
 def check_rss_health():
     """
@@ -60,70 +158,20 @@ def check_rss_health():
     # EEI feed disabled (LinkedIn source discontinued). Retain code but skip monitoring.
     rss_files = ['ai_rss_feed.xml', 'ai_rss_feed_archive.xml']
     # Add dynamically discovered aggregated outputs and their archives
-    for out in _discover_aggregated_outputs():
+    for out in _discover_aggregated_outputs(_config_mtime()):
         if out not in rss_files:
             rss_files.append(out)
         archive_variant = out.replace('.xml', '_archive.xml')
         if archive_variant not in rss_files:
             rss_files.append(archive_variant)
     
-    for rss_file in rss_files:
-        feed_status = {
-            'exists': False,
-            'valid_xml': False,
-            'entry_count': 0,
-            'last_updated': None,
-            'size_bytes': 0,
-            'errors': []
-        }
-        
-        try:
-            if Path(rss_file).exists():
-                feed_status['exists'] = True
-                feed_status['size_bytes'] = Path(rss_file).stat().st_size
-                
-                # Parse XML to check validity and count entries
-                try:
-                    tree = ET.parse(rss_file)
-                    root = tree.getroot()
-                    feed_status['valid_xml'] = True
-                    
-                    # Count items
-                    items = root.findall('.//item')
-                    feed_status['entry_count'] = len(items)
-                    
-                    # Get last build date
-                    last_build = root.find('.//lastBuildDate')
-                    if last_build is not None:
-                        feed_status['last_updated'] = last_build.text
-                    
-                    # Check for minimum entries
-                    if feed_status['entry_count'] == 0:
-                        feed_status['errors'].append('No entries in RSS feed')
-                        status['overall_status'] = 'warning'
-                    elif feed_status['entry_count'] < 5:
-                        feed_status['errors'].append(f'Low entry count: {feed_status["entry_count"]}')
-                        status['overall_status'] = 'warning'
-                        
-                except ET.ParseError as e:
-                    feed_status['errors'].append(f'Invalid XML: {str(e)}')
-                    status['overall_status'] = 'error'
-                    
-            else:
-                # Treat missing archives as warning, primary feeds as error
-                if rss_file.endswith('_archive.xml'):
-                    feed_status['errors'].append('Archive not yet created')
-                    if status['overall_status'] != 'error':
-                        status['overall_status'] = 'warning'
-                else:
-                    feed_status['errors'].append('RSS file does not exist')
-                    status['overall_status'] = 'error'
-                
-        except Exception as e:
-            feed_status['errors'].append(f'Unexpected error: {str(e)}')
-            status['overall_status'] = 'error'
-        
+    # Feeds are independent files, so check them concurrently; results come back in rss_files order
+    with ThreadPoolExecutor(max_workers=min(8, len(rss_files))) as executor:
+        results = list(executor.map(_check_feed, rss_files))
+    for rss_file, (feed_status, severity) in zip(rss_files, results):
         status['feeds'][rss_file] = feed_status
+        if severity == 'error' or (severity == 'warning' and status['overall_status'] != 'error'):
+            status['overall_status'] = severity
     
     # Augment with aggregation health summaries if present
     aggregation_health = {}
@@ -135,8 +183,11 @@ def check_rss_health():
             health_path = Path(feed_name.replace('.xml', '_health.json'))
             if health_path.exists():
                 try:
-                    with open(health_path, 'r', encoding='utf-8') as hf:
-                        hdata = json.load(hf)
+                    if orjson:
+                        hdata = orjson.loads(health_path.read_bytes())
+                    else:
+                        with open(health_path, 'r', encoding='utf-8') as hf:
+                            hdata = json.load(hf)
                     aggregation_health[feed_name] = {
                         'total_sources': hdata.get('total_sources'),
                         'attempted': hdata.get('attempted'),
@@ -150,7 +201,7 @@ def check_rss_health():
                     for detail in hdata.get('details', []):
                         cf = detail.get('consecutive_failures', 0)
                         err = (detail.get('last_error') or '').lower()
-                        perm_marker = any(m in err for m in ['ssl', 'name or service not known', 'nodename nor servname', 'nxdomain', 'temporary failure in name resolution'])
+                        perm_marker = _PERM_ERR_RE.search(err) is not None
                         if detail.get('status') == 'failed' and (cf >= 3 or perm_marker):
                             pruning_suggestions.append({
                                 'feed': feed_name,
@@ -180,8 +231,11 @@ def save_status_report(status):
         status (dict): Status report dictionary
     """
     try:
-        with open('rss_status.json', 'w') as f:
-            json.dump(status, f, indent=2)
+        if orjson:
+            Path('rss_status.json').write_bytes(orjson.dumps(status, option=orjson.OPT_INDENT_2))
+        else:
+            with open('rss_status.json', 'w') as f:
+                json.dump(status, f, indent=2)
         print("Status report saved to rss_status.json")
     except Exception as e:
         print(f"Error saving status report: {e}")